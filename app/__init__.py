@@ -3,6 +3,8 @@ import os
 from flask import Flask
 from dotenv import load_dotenv
 
+from .auth import DEFAULT_API_KEY
+
 # Load environment variables
 load_dotenv()
 
@@ -14,8 +16,13 @@ def create_app(test_config=None):
     if test_config is None:
         app.config.from_mapping(
             SECRET_KEY=os.getenv('SECRET_KEY', 'dev-secret-key'),
-            API_KEY=os.getenv('API_KEY', 'default-api-key'),
+            API_KEY=os.getenv('API_KEY', DEFAULT_API_KEY),
             MODELS_DIR=os.getenv('MODELS_DIR', 'app/models'),
+            # Shared Redis counters when configured (see docker-compose.yml),
+            # per-process memory otherwise
+            RATELIMIT_STORAGE_URI=os.getenv('RATELIMIT_STORAGE_URI', 'memory://'),
+            # Keep limiting in memory instead of failing requests if Redis is down
+            RATELIMIT_IN_MEMORY_FALLBACK_ENABLED=True,
             SWAGGER={
                 'title': 'ML Model API',
                 'uiversion': 3,
@@ -25,6 +32,9 @@ def create_app(test_config=None):
     else:
         app.config.from_mapping(test_config)
     
+    # The API key does not change at runtime, so encode it once for auth
+    app.extensions['api_key'] = app.config.get('API_KEY', DEFAULT_API_KEY).encode()
+    
     # Initialize logging
     from .logging_config import setup_logging
     setup_logging(app)
@@ -34,27 +44,18 @@ def create_app(test_config=None):
     init_models(app)
     
     # Initialize extensions
-    from flask_limiter import Limiter
-    from flask_limiter.util import get_remote_address
     from flasgger import Swagger
     
-    # Create global limiter instance
-    app.limiter = Limiter(
-        app=app,
-        key_func=get_remote_address,
-        default_limits=["200 per day", "50 per hour"],
-    )
-    
     # Create global swagger instance
     app.swagger = Swagger(app)
     
     # Register blueprints
-    from .main import bp as main_bp
+    from .main import bp as main_bp, limiter
     app.register_blueprint(main_bp)
     
-    # Initialize limiter with app context
-    with app.app_context():
-        from .main import limiter as bp_limiter
-        bp_limiter.init_app(app)
+    # Bind the blueprint's limiter; with RATELIMIT_STORAGE_URI pointing at
+    # Redis every worker shares the same counters
+    limiter.init_app(app)
+    app.limiter = limiter
     
     return app
\ No newline at end of file
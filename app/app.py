@@ -1,19 +1,40 @@
-import gradio as gr
-import joblib
+# app/app.py
+"""
+Gradio demo for the ML model.
 
-# Load your ML model
-model = joblib.load("model.pkl")
+Run with `python -m app.app`. Importing this module does not load a model or
+start a server; predictions go through the shared model manager, which is
+initialized on first use.
+"""
+
+from .models import models, init_models, validate_model_input
+
+def _get_model_manager():
+    # Load models lazily so importing the demo stays cheap
+    if not models.model_manager.models:
+        init_models()
+    return models.model_manager
 
 def predict(text):
-    # Example: you might need to preprocess text
-    return model.predict([text])[0]
+    # Features are entered as comma-separated numbers, e.g. "5.1, 3.5, 1.4, 0.2"
+    features = [value.strip() for value in text.split(',')]
+    validation_result = validate_model_input(features)
+    if not validation_result['valid']:
+        return validation_result['message']
+    
+    result = _get_model_manager().predict([float(value) for value in features])
+    return result['class_name']
 
-demo = gr.Interface(
-    fn=predict,
-    inputs="text",
-    outputs="text",
-    title="My Model Demo",
-    description="Enter input text or features and get prediction"
-)
+def build_demo():
+    import gradio as gr
+    
+    return gr.Interface(
+        fn=predict,
+        inputs="text",
+        outputs="text",
+        title="My Model Demo",
+        description="Enter input features separated by commas and get prediction"
+    )
 
-demo.launch()
+if __name__ == "__main__":
+    build_demo().launch()
@@ -1,18 +1,22 @@
 # app/auth.py
 from functools import wraps
-from flask import request, jsonify
-import os
+from flask import current_app, request, jsonify
+import hmac
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Key accepted when API_KEY is not configured; set API_KEY in production
+DEFAULT_API_KEY = 'default-secret-key'
+
 def api_key_required(f):
     @wraps(f)
     def decorated_function(*args, **kwargs):
-        api_key = request.headers.get('X-API-KEY')
-        valid_api_key = os.getenv('API_KEY', 'default-secret-key')
+        api_key = request.headers.get('X-API-KEY', '').encode()
+        # Encoded once per app in create_app from app.config['API_KEY']
+        valid_api_key = current_app.extensions['api_key']
         
-        if not api_key or api_key != valid_api_key:
+        if not api_key or not hmac.compare_digest(api_key, valid_api_key):
             logger.warning(f"Invalid API key attempt from {request.remote_addr}")
             return jsonify({'error': 'Invalid or missing API key'}), 401
         
@@ -1,16 +1,60 @@
 # app/logging_config.py
+import atexit
 import logging
-from logging.handlers import RotatingFileHandler
+import queue
+import threading
+from logging.handlers import MemoryHandler, QueueHandler, QueueListener, RotatingFileHandler
 import os
+from flask.logging import default_handler
 
-def setup_logging(app):
+FLUSH_INTERVAL = 0.5  # seconds between forced flushes of buffered file records
+
+def _start_periodic_flush(handler, interval=FLUSH_INTERVAL):
+    """Flush a buffering handler from a daemon thread every `interval` seconds."""
+    stopped = threading.Event()
+    
+    def run():
+        while not stopped.wait(interval):
+            handler.flush()
+    
+    threading.Thread(target=run, name='log-flush', daemon=True).start()
+    return stopped
+
+# Process-wide logging pipeline, shared by every app created in this process
+# (the app logger is the same logging.Logger for all of them)
+_queue_handler = None
+_buffered_file_handler = None
+_console_handler = None
+# Listener and flush-thread stop event running in this process, if any
+_listener = None
+_flush_stopped = None
+# Serializes start_log_threads and stop_log_threads within a process
+_threads_lock = threading.Lock()
+
+class _ProcessQueueHandler(QueueHandler):
+    """
+    Queue handler whose listener is started on first use in each process.
+    
+    After a fork the child gets queue = None (see _after_fork_in_child), so
+    the first record it logs starts the child's own listener and flusher.
+    """
+    
+    def __init__(self):
+        super().__init__(None)
+    
+    def emit(self, record):
+        if self.queue is None:
+            start_log_threads()
+        super().emit(record)
+
+def _create_handlers(log_level):
+    """Create the file and console handlers and the queue handler in front of them."""
+    global _queue_handler, _buffered_file_handler, _console_handler
+    
     # Create logs directory if it doesn't exist
     if not os.path.exists('logs'):
         os.makedirs('logs')
     
-    # Set logging level
-    log_level = os.getenv('LOG_LEVEL', 'INFO').upper()
-    
     # File handler
     file_handler = RotatingFileHandler(
         'logs/app.log', 
@@ -22,6 +66,15 @@ def setup_logging(app):
     ))
     file_handler.setLevel(log_level)
     
+    # Buffer file records so they reach disk in batches; errors flush at once
+    buffered_file_handler = MemoryHandler(
+        capacity=512,
+        flushLevel=logging.ERROR,
+        target=file_handler,
+        flushOnClose=True
+    )
+    buffered_file_handler.setLevel(log_level)
+    
     # Console handler
     console_handler = logging.StreamHandler()
     console_handler.setFormatter(logging.Formatter(
@@ -29,10 +82,88 @@ def setup_logging(app):
     ))
     console_handler.setLevel(log_level)
     
-    # Add handlers to app logger
-    app.logger.addHandler(file_handler)
-    app.logger.addHandler(console_handler)
+    _queue_handler = _ProcessQueueHandler()
+    _buffered_file_handler = buffered_file_handler
+    _console_handler = console_handler
+
+def start_log_threads():
+    """
+    Start the listener and periodic flush threads, once per process.
+    
+    Runs on the first record logged in a process, or earlier from gunicorn's
+    post_fork hook, so every worker starts its own with a queue created
+    after the fork.
+    """
+    global _listener, _flush_stopped
+    
+    with _threads_lock:
+        if _queue_handler is None or _queue_handler.queue is not None:
+            return
+        
+        # Hand records off to a background thread so request handlers never
+        # block on file or console I/O
+        log_queue = queue.Queue(maxsize=10000)
+        _listener = QueueListener(
+            log_queue,
+            _buffered_file_handler,
+            _console_handler,
+            respect_handler_level=True
+        )
+        _listener.start()
+        _flush_stopped = _start_periodic_flush(_buffered_file_handler)
+        _queue_handler.queue = log_queue
+
+def stop_log_threads():
+    """
+    Stop this process's logging threads, writing out everything logged so far.
+    
+    Drains the queue, stops the flusher and flushes the buffer, in that order.
+    Registered with atexit; call it directly to flush before a controlled
+    shutdown. A later record starts the threads again.
+    """
+    global _listener, _flush_stopped
+    
+    with _threads_lock:
+        if _listener is None:
+            return
+        _listener.stop()
+        _flush_stopped.set()
+        _buffered_file_handler.flush()
+        _queue_handler.queue = None
+        _listener = _flush_stopped = None
+
+def _before_fork():
+    # Write out buffered records so the child does not inherit, and repeat, them
+    if _buffered_file_handler is not None:
+        _buffered_file_handler.flush()
+
+def _after_fork_in_child():
+    # The parent's threads do not exist here and its queue and lock may have
+    # been mid-use at fork time; start over with fresh ones on first use
+    global _listener, _flush_stopped, _threads_lock
+    _threads_lock = threading.Lock()
+    _listener = _flush_stopped = None
+    if _queue_handler is not None:
+        _queue_handler.queue = None
+
+atexit.register(stop_log_threads)
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(before=_before_fork, after_in_child=_after_fork_in_child)
+
+def setup_logging(app):
+    # Set logging level
+    log_level = os.getenv('LOG_LEVEL', 'INFO').upper()
+    
+    # Built once per process, so creating several apps (one per test, say)
+    # does not leak threads or open files
+    if _queue_handler is None:
+        _create_handlers(log_level)
+    
+    # Add queue handler to app logger, unless an earlier app already did
+    if _queue_handler not in app.logger.handlers:
+        app.logger.addHandler(_queue_handler)
     app.logger.setLevel(log_level)
+    app.logger.propagate = False
     
     # Remove default Flask handler
-    app.logger.removeHandler(app.logger.handlers[0])
\ No newline at end of file
+    app.logger.removeHandler(default_handler)
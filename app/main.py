@@ -1,24 +1,42 @@
 # app/main.py (updated to use models module)
-from flask import Blueprint, request, jsonify
+from flask import Blueprint, current_app, request
 from flask_limiter import Limiter
+from flask_limiter.util import get_remote_address
 from flasgger import Swagger
 import logging
-from datetime import datetime
+import orjson
 
 # Import from local modules
 from .auth import api_key_required
-from .models import model_manager, validate_model_input, format_prediction_response
+from .models import (
+    model_manager, validate_model_input, validate_batch_input, format_prediction_response, now_iso
+)
 from .models.model_utils import get_feature_names, get_class_names
-from app.main import app
+
+logger = logging.getLogger(__name__)
 
 # Create blueprint
 bp = Blueprint('main', __name__)
 
 # Initialize extensions (will be initialized in create_app)
-limiter = Limiter()
+limiter = Limiter(
+    get_remote_address,
+    default_limits=["200 per day", "50 per hour"],
+    strategy="moving-window",
+)
 swagger = Swagger()
 
+def _json_response(data, status=200):
+    """Serialize a response body with orjson, which also handles numpy values natively"""
+    return current_app.response_class(
+        orjson.dumps(data, option=orjson.OPT_SERIALIZE_NUMPY),
+        status=status,
+        mimetype='application/json'
+    )
+
 @bp.route('/health', methods=['GET'])
+# Probes hit this every few seconds; the default limits would answer them 429
+@limiter.exempt
 def health_check():
     """
     Health check endpoint
@@ -29,15 +47,11 @@ def health_check():
       200:
         description: API is healthy
     """
-    models_loaded = len(model_manager.loaded_versions) > 0
-    status = 'healthy' if models_loaded else 'degraded'
-    
-    return jsonify({
-        'status': status,
-        'models_loaded': model_manager.loaded_versions,
-        'active_model': model_manager.active_model_version,
-        'timestamp': datetime.now().isoformat()
-    })
+    # Body is cached on the manager and reused within the same second
+    return current_app.response_class(
+        model_manager.get_health_body(),
+        mimetype='application/json'
+    )
 
 @bp.route('/predict', methods=['POST'])
 @api_key_required
@@ -82,20 +96,20 @@ def predict():
     """
     try:
         # Log the request
-        logging.info(f"Prediction request from {request.remote_addr}")
+        logger.debug("Prediction request from %s", request.remote_addr)
         
         # Get the data from the request
         data = request.get_json()
         
         if not data or 'features' not in data:
-            logging.warning("Missing features in request")
-            return jsonify({'error': 'Features array is required'}), 400
+            logger.warning("Missing features in request")
+            return _json_response({'error': 'Features array is required'}, 400)
         
         # Validate input
         validation_result = validate_model_input(data['features'])
         if not validation_result['valid']:
-            logging.warning(f"Invalid features: {validation_result['message']}")
-            return jsonify({'error': validation_result['message']}), 400
+            logger.warning(f"Invalid features: {validation_result['message']}")
+            return _json_response({'error': validation_result['message']}, 400)
         
         # Get model version from request or use default
         model_version = data.get('model_version')
@@ -107,16 +121,89 @@ def predict():
         response_data = format_prediction_response(prediction_result)
         
         # Log successful prediction
-        logging.info(f"Prediction successful: {response_data}")
+        logger.debug("Prediction successful: %s", response_data)
         
-        return jsonify(response_data)
+        return _json_response(response_data)
         
     except ValueError as e:
-        logging.warning(f"Prediction validation error: {str(e)}")
-        return jsonify({'error': str(e)}), 400
+        logger.warning(f"Prediction validation error: {str(e)}")
+        return _json_response({'error': str(e)}, 400)
     except Exception as e:
-        logging.error(f"Prediction error: {str(e)}")
-        return jsonify({'error': 'Internal server error'}), 500
+        logger.error(f"Prediction error: {str(e)}")
+        return _json_response({'error': 'Internal server error'}, 500)
+
+@bp.route('/predict_batch', methods=['POST'])
+@api_key_required
+@limiter.limit("10 per minute")
+def predict_batch():
+    """
+    Make predictions for several samples in one request
+    ---
+    tags:
+      - Predictions
+    parameters:
+      - in: header
+        name: X-API-KEY
+        required: true
+        schema:
+          type: string
+        description: API key for authentication
+      - in: body
+        name: batch
+        required: true
+        schema:
+          type: object
+          properties:
+            batch:
+              type: array
+              items:
+                type: array
+                items:
+                  type: number
+              example: [[5.1, 3.5, 1.4, 0.2], [6.7, 3.0, 5.2, 2.3]]
+            model_version:
+              type: string
+              description: Specific model version to use
+              example: v1
+    responses:
+      200:
+        description: Prediction results, one per sample
+      400:
+        description: Invalid input
+      401:
+        description: Unauthorized
+      500:
+        description: Server error
+    """
+    try:
+        data = request.get_json()
+        
+        if not data or 'batch' not in data:
+            logger.warning("Missing batch in request")
+            return _json_response({'error': 'Batch array is required'}, 400)
+        
+        # Validate input as one (n, 4) array
+        validation_result = validate_batch_input(data['batch'])
+        if not validation_result['valid']:
+            logger.warning(f"Invalid batch: {validation_result['message']}")
+            return _json_response({'error': validation_result['message']}, 400)
+        
+        model_version = data.get('model_version') or model_manager.active_model_version
+        
+        predictions = model_manager.predict_batch(validation_result['features'], model_version)
+        
+        return _json_response({
+            'predictions': predictions,
+            'model_version': model_version,
+            'timestamp': now_iso()
+        })
+        
+    except ValueError as e:
+        logger.warning(f"Batch prediction validation error: {str(e)}")
+        return _json_response({'error': str(e)}, 400)
+    except Exception as e:
+        logger.error(f"Batch prediction error: {str(e)}")
+        return _json_response({'error': 'Internal server error'}, 500)
 
 @bp.route('/models', methods=['GET'])
 @api_key_required
@@ -132,14 +219,14 @@ def list_models():
     """
     try:
         models_info = model_manager.get_all_models_info()
-        return jsonify({
+        return _json_response({
             'models': models_info,
             'active_model': model_manager.active_model_version,
-            'timestamp': datetime.now().isoformat()
+            'timestamp': now_iso()
         })
     except Exception as e:
-        logging.error(f"Error getting models info: {str(e)}")
-        return jsonify({'error': 'Internal server error'}), 500
+        logger.error(f"Error getting models info: {str(e)}")
+        return _json_response({'error': 'Internal server error'}, 500)
 
 @bp.route('/models/<version>', methods=['GET'])
 @api_key_required
@@ -165,38 +252,21 @@ def get_model_info(version):
     try:
         model_info = model_manager.get_model_info(version)
         if 'error' in model_info:
-            return jsonify({'error': model_info['error']}), 404
+            return _json_response({'error': model_info['error']}, 404)
         
-        return jsonify(model_info)
+        return _json_response(model_info)
     except Exception as e:
-        logging.error(f"Error getting model info for {version}: {str(e)}")
-        return jsonify({'error': 'Internal server error'}), 500
+        logger.error(f"Error getting model info for {version}: {str(e)}")
+        return _json_response({'error': 'Internal server error'}, 500)
 
 # Error handlers
 @bp.errorhandler(404)
 def not_found(error):
-    return jsonify({'error': 'Endpoint not found'}), 404
+    return _json_response({'error': 'Endpoint not found'}, 404)
 
 @bp.errorhandler(429)
 def ratelimit_handler(e):
-    return jsonify({'error': 'Rate limit exceeded'}), 429
+    return _json_response({'error': 'Rate limit exceeded'}, 429)
 
 # Export the blueprint
-__all__ = ['bp']
-
-import gradio as gr
-import joblib
-
-# Load your model (example: sklearn)
-model = joblib.load("model.pkl")
-
-def predict(text):
-    return model.predict([text])[0]
-
-demo = gr.Interface(fn=predict,
-                    inputs="text",
-                    outputs="text",
-                    title="My Model Demo",
-                    description="Enter text and see prediction")
-
-demo.launch()
+__all__ = ['bp']
\ No newline at end of file
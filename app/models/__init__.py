@@ -5,9 +5,10 @@ Models package for ML Model Deployment API
 This package contains model management, loading, and prediction utilities.
 """
 
-from .models import ModelManager, model_manager, init_models
+from .models import ModelManager, ModelMeta, model_manager, init_models, now_iso
 from .model_utils import (
     validate_model_input,
+    validate_batch_input,
     format_prediction_response,
     get_feature_names,
     get_class_names
@@ -16,9 +17,12 @@ from .model_utils import (
 # Export public interface
 __all__ = [
     'ModelManager',
+    'ModelMeta',
     'model_manager',
     'init_models',
+    'now_iso',
     'validate_model_input',
+    'validate_batch_input',
     'format_prediction_response',
     'get_feature_names',
     'get_class_names'
@@ -0,0 +1,193 @@
+# app/models/model_utils.py
+"""
+Model utilities for ML Model Deployment API
+
+Utility functions for model management, validation, and operations.
+"""
+
+import numpy as np
+from typing import Dict, Any, List, Optional
+import logging
+
+logger = logging.getLogger(__name__)
+
+def validate_model_input(features: List[float], expected_length: int = 4) -> Dict[str, Any]:
+    """
+    Validate input features for model prediction.
+    
+    Args:
+        features (List[float]): Input features to validate
+        expected_length (int): Expected number of features
+        
+    Returns:
+        Dict[str, Any]: Validation result with status and message
+    """
+    if not isinstance(features, list):
+        return {'valid': False, 'message': 'Features must be a list'}
+    
+    if len(features) != expected_length:
+        return {
+            'valid': False, 
+            'message': f'Features array must contain exactly {expected_length} values, got {len(features)}'
+        }
+    
+    # Fast path: one C-level conversion and range check over the whole vector
+    try:
+        values = np.asarray(features, dtype=np.float64)
+    except (ValueError, TypeError):
+        values = None
+    
+    # Reasonable range validation for iris features (NaN fails the check too)
+    if values is not None and values.shape == (expected_length,) and ((values >= 0) & (values <= 10)).all():
+        return {'valid': True, 'message': 'Features are valid'}
+    
+    # Slow path, only for invalid input: find the first offending feature
+    for i, value in enumerate(features):
+        error = _feature_error(i, value)
+        if error is not None:
+            return {'valid': False, 'message': error}
+    
+    return {'valid': True, 'message': 'Features are valid'}
+
+# Largest batch accepted for one prediction request; bounds the memory and
+# model time a single request can take
+MAX_BATCH_SIZE = 1000
+
+def validate_batch_input(batch: Any, expected_length: int = 4) -> Dict[str, Any]:
+    """
+    Validate a batch of input feature vectors for model prediction.
+    
+    Every value is held to the same 0-10 range as in validate_model_input,
+    with one vectorized check over the whole batch.
+    
+    Args:
+        batch (Any): Input batch, a list of feature lists
+        expected_length (int): Expected number of features per sample
+        
+    Returns:
+        Dict[str, Any]: Validation result with status and message; a valid
+        result also holds the batch as a float64 array under 'features'
+    """
+    if not isinstance(batch, list) or not batch:
+        return {'valid': False, 'message': 'Batch must be a non-empty list of feature arrays'}
+    
+    if len(batch) > MAX_BATCH_SIZE:
+        return {
+            'valid': False,
+            'message': f'Batch must contain at most {MAX_BATCH_SIZE} samples, got {len(batch)}'
+        }
+    
+    try:
+        values = np.asarray(batch, dtype=np.float64)
+    except (ValueError, TypeError):
+        return {'valid': False, 'message': 'Batch must be an array of numeric feature arrays'}
+    
+    if values.ndim != 2 or values.shape[1] != expected_length:
+        return {
+            'valid': False,
+            'message': f'Each batch entry must contain exactly {expected_length} values'
+        }
+    
+    # NaN fails the range check too
+    out_of_range = ~((values >= 0) & (values <= 10))
+    if out_of_range.any():
+        row, col = np.argwhere(out_of_range)[0].tolist()
+        return {
+            'valid': False,
+            'message': f'Feature at index {col} of sample {row} must be between 0 and 10, got {values[row, col]}'
+        }
+    
+    return {'valid': True, 'message': 'Batch is valid', 'features': values}
+
+def _feature_error(index: int, value: Any) -> Optional[str]:
+    """
+    Describe why a single feature is invalid.
+    
+    Args:
+        index (int): Position of the feature in the input
+        value (Any): Feature value
+        
+    Returns:
+        Optional[str]: Error message, or None if the feature is valid
+    """
+    try:
+        float_value = float(value)
+    except (ValueError, TypeError):
+        return f'Feature at index {index} must be a number, got {type(value).__name__}'
+    
+    if not (0 <= float_value <= 10):
+        return f'Feature at index {index} must be between 0 and 10, got {float_value}'
+    
+    return None
+
+# Fields returned to API clients for a single prediction
+PREDICTION_RESPONSE_FIELDS = frozenset(
+    ('prediction', 'class_name', 'confidence', 'confidence_max', 'model_version', 'timestamp')
+)
+
+def format_prediction_response(prediction_result: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Format prediction response for API output.
+    
+    Results from ModelManager.predict already have exactly the response
+    fields and are returned as-is; anything else is copied down to them.
+    
+    Args:
+        prediction_result (Dict[str, Any]): Raw prediction result
+        
+    Returns:
+        Dict[str, Any]: Formatted API response
+    """
+    if prediction_result.keys() == PREDICTION_RESPONSE_FIELDS:
+        return prediction_result
+    
+    return {
+        'prediction': prediction_result['prediction'],
+        'class_name': prediction_result.get('class_name', f'class_{prediction_result["prediction"]}'),
+        'confidence': prediction_result['confidence'],
+        'confidence_max': prediction_result['confidence_max'],
+        'model_version': prediction_result['model_version'],
+        'timestamp': prediction_result['timestamp']
+    }
+
+def get_feature_names(dataset: str = 'iris') -> List[str]:
+    """
+    Get feature names for a dataset.
+    
+    Args:
+        dataset (str): Dataset identifier
+        
+    Returns:
+        List[str]: List of feature names
+    """
+    feature_map = {
+        'iris': ['sepal_length', 'sepal_width', 'petal_length', 'petal_width'],
+        'default': ['feature_0', 'feature_1', 'feature_2', 'feature_3']
+    }
+    
+    return feature_map.get(dataset, feature_map['default'])
+
+def get_class_names(dataset: str = 'iris') -> Dict[int, str]:
+    """
+    Get class names mapping for a dataset.
+    
+    Args:
+        dataset (str): Dataset identifier
+        
+    Returns:
+        Dict[int, str]: Mapping of class indices to names
+    """
+    class_map = {
+        'iris': {
+            0: 'Iris-setosa',
+            1: 'Iris-versicolor', 
+            2: 'Iris-virginica'
+        },
+        'default': {
+            0: 'class_0',
+            1: 'class_1',
+            2: 'class_2'
+        }
+    }
+    
+    return class_map.get(dataset, class_map['default'])
\ No newline at end of file
@@ -7,23 +7,190 @@ This module contains model loading, management, and prediction utilities.
 
 import joblib
 import numpy as np
+import orjson
 import logging
-from typing import Dict, Any, List, Tuple, Optional
-from datetime import datetime
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Callable, Dict, Any, List, Set, Tuple, Optional
+from datetime import datetime, timezone
 import os
+import threading
+import time
+from sklearn.linear_model import LogisticRegression
 
 logger = logging.getLogger(__name__)
 
+# Maximum number of distinct (version, features) results kept per manager
+PREDICTION_CACHE_SIZE = 4096
+
+# Number of input features expected by the models (Iris dataset)
+N_FEATURES = 4
+
+# (epoch second, ISO string) for the most recent timestamp handed out
+_timestamp_cache: Tuple[int, str] = (0, '')
+
+def now_iso() -> str:
+    """
+    Current UTC time as an ISO 8601 string, rebuilt at most once per second.
+    
+    Returns:
+        str: Timestamp such as 2025-10-02T20:48:28Z
+    """
+    global _timestamp_cache
+    second = int(time.time())
+    cached_second, cached_iso = _timestamp_cache
+    if second != cached_second:
+        # Rebinding a tuple is atomic, so concurrent callers see a consistent pair
+        cached_iso = datetime.fromtimestamp(second, timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ')
+        _timestamp_cache = (second, cached_iso)
+    return cached_iso
+
+# Single-sample predictor: feature vector -> (predicted label, class probabilities)
+FastPredict = Callable[[np.ndarray], Tuple[int, np.ndarray]]
+
+def build_fast_predict(model: Any) -> Optional[FastPredict]:
+    """
+    Specialize a fitted model into a plain numpy single-sample predictor.
+    
+    Only logistic regression is supported: its prediction is one small
+    matrix-vector product, so skipping sklearn's input checks and dispatch
+    removes nearly all of the per-call cost. Other models return None and
+    keep using predict/predict_proba.
+    
+    Args:
+        model (Any): Fitted estimator
+        
+    Returns:
+        Optional[FastPredict]: Predictor, or None if the model is not supported
+    """
+    if not isinstance(model, LogisticRegression):
+        return None
+    
+    coef = np.ascontiguousarray(model.coef_, dtype=np.float64)
+    intercept = np.array(model.intercept_, dtype=np.float64)
+    classes = model.classes_.tolist()
+    
+    # Same rule LogisticRegression.predict_proba uses: per-class sigmoids for
+    # 'ovr', and for 'auto' with a binary problem or the liblinear solver
+    multi_class = getattr(model, 'multi_class', 'auto')
+    ovr = multi_class in ('ovr', 'warn') or (
+        multi_class in ('auto', 'deprecated') and (len(classes) <= 2 or model.solver == 'liblinear')
+    )
+    
+    if coef.shape[0] == 1:
+        # Binary multinomial is a softmax over [-d, d]; leave it to sklearn
+        if not ovr:
+            return None
+        
+        # Binary one-vs-rest: sigmoid of a single decision value
+        weights, bias = coef[0], float(intercept[0])
+        
+        def fast_predict(x: np.ndarray) -> Tuple[int, np.ndarray]:
+            positive = 1.0 / (1.0 + np.exp(-(weights @ x + bias)))
+            return classes[int(positive > 0.5)], np.array([1.0 - positive, positive])
+        
+        return fast_predict
+    
+    # Multiclass one-vs-rest normalizes per-class sigmoids instead of a softmax
+    if ovr:
+        return None
+    
+    def fast_predict(x: np.ndarray) -> Tuple[int, np.ndarray]:
+        logits = coef @ x + intercept
+        exp_logits = np.exp(logits - logits.max())
+        proba = exp_logits / exp_logits.sum()
+        return classes[int(proba.argmax())], proba
+    
+    return fast_predict
+
+@dataclass
+class ModelMeta:
+    """
+    A loaded model together with the metadata read from it once at load time.
+    """
+    model: Any
+    model_type: str
+    classes: Optional[Tuple[str, ...]]
+    n_features: Optional[int]
+    n_classes: Optional[int]
+    n_estimators: Optional[int]
+    fast_predict: Optional[FastPredict] = None
+    info: Dict[str, Any] = field(default_factory=dict)
+    
+    @classmethod
+    def from_model(cls, version: str, model: Any) -> 'ModelMeta':
+        """
+        Capture the metadata of a fitted estimator.
+        
+        Args:
+            version (str): Model version identifier
+            model (Any): Fitted estimator
+            
+        Returns:
+            ModelMeta: Model with its precomputed metadata
+        """
+        class_labels = getattr(model, 'classes_', None)
+        estimators = getattr(model, 'estimators_', None)
+        meta = cls(
+            model=model,
+            model_type=type(model).__name__,
+            classes=tuple(str(label) for label in class_labels) if class_labels is not None else None,
+            n_features=getattr(model, 'n_features_in_', None),
+            n_classes=getattr(model, 'n_classes_', None),
+            n_estimators=len(estimators) if estimators is not None else None,
+            fast_predict=build_fast_predict(model)
+        )
+        
+        meta.info = {
+            'version': version,
+            'model_type': meta.model_type,
+            'loaded': True,
+            'n_features': meta.n_features if meta.n_features is not None else 'unknown',
+            'n_classes': meta.n_classes if meta.n_classes is not None else 'unknown',
+            'classes': class_labels.tolist() if class_labels is not None else []
+        }
+        
+        # Add model-specific attributes
+        if meta.n_estimators is not None:
+            meta.info['n_estimators'] = meta.n_estimators
+        
+        return meta
+    
+    def class_name(self, prediction: int) -> str:
+        """
+        Get the class name for a predicted label.
+        
+        Args:
+            prediction (int): Predicted class label
+            
+        Returns:
+            str: Class name, 'unknown' if out of range
+        """
+        if self.classes is None:
+            return f'class_{prediction}'
+        return self.classes[prediction] if len(self.classes) > prediction else 'unknown'
+
 class ModelManager:
     """
     Manager class for handling ML models with versioning and fallback support.
+    
+    Under gunicorn with preload_app the manager is populated once in the master
+    and shared copy-on-write with forked workers. Anything changed afterwards
+    (load_model, set_active_version) only affects the worker that made the call.
     """
     
     def __init__(self, models_dir: str = 'app/models'):
         self.models_dir = models_dir
-        self.models: Dict[str, Any] = {}
+        self.models: Dict[str, ModelMeta] = {}
         self.active_model_version = 'v1'
-        self.loaded_versions: List[str] = []
+        self.loaded_versions: Set[str] = set()
+        self._cached_predict = lru_cache(maxsize=PREDICTION_CACHE_SIZE)(self._predict_uncached)
+        # Per-thread input buffers reused across predictions
+        self._tls = threading.local()
+        # Serializes changes to the loaded models and active version
+        self._lock = threading.Lock()
+        # (epoch second, JSON body) of the last health response
+        self._health_body: Optional[Tuple[int, bytes]] = None
     
     def load_model(self, version: str = 'v1', model_path: Optional[str] = None) -> bool:
         """
@@ -44,9 +211,17 @@ class ModelManager:
                 logger.error(f"Model file not found: {model_path}")
                 return False
             
+            # train_model.py saves LZ4-compressed pickles, which joblib cannot
+            # memory-map; with preload_app, workers share the loaded arrays
+            # copy-on-write instead
             model = joblib.load(model_path)
-            self.models[version] = model
-            self.loaded_versions.append(version)
+            meta = ModelMeta.from_model(version, model)
+            with self._lock:
+                self.models[version] = meta
+                # Results computed by a previous model under this version are stale
+                self._cached_predict.cache_clear()
+                self.loaded_versions.add(version)
+                self._health_body = None
             logger.info(f"Model version {version} loaded successfully from {model_path}")
             return True
             
@@ -64,10 +239,14 @@ class ModelManager:
         results = {}
         try:
             # Look for model files in the models directory
-            for file_name in os.listdir(self.models_dir):
-                if file_name.startswith('model_') and file_name.endswith('.pkl'):
-                    version = file_name.replace('model_', '').replace('.pkl', '')
-                    results[version] = self.load_model(version)
+            with os.scandir(self.models_dir) as entries:
+                for entry in entries:
+                    if not entry.is_file():
+                        continue
+                    file_name = entry.name
+                    if file_name.startswith('model_') and file_name.endswith('.pkl'):
+                        version = file_name.removeprefix('model_').removesuffix('.pkl')
+                        results[version] = self.load_model(version, model_path=entry.path)
             
             # If no models found, try loading default
             if not results:
@@ -99,43 +278,130 @@ class ModelManager:
         
         try:
             # Validate input features
-            if len(features) != 4:  # Assuming Iris dataset with 4 features
-                error_msg = f"Expected 4 features, got {len(features)}"
+            if len(features) != N_FEATURES:  # Assuming Iris dataset with 4 features
+                error_msg = f"Expected {N_FEATURES} features, got {len(features)}"
                 logger.error(error_msg)
                 raise ValueError(error_msg)
             
-            # Convert to numpy array and reshape
-            features_array = np.array(features).reshape(1, -1)
-            
-            # Make prediction
-            model = self.models[version]
-            prediction = model.predict(features_array)
-            prediction_proba = model.predict_proba(features_array)
-            
-            # Get class names if available
-            class_names = getattr(model, 'classes_', None)
-            if class_names is not None:
-                class_name = str(class_names[prediction[0]]) if len(class_names) > prediction[0] else 'unknown'
-            else:
-                class_name = f'class_{prediction[0]}'
+            # Identical feature vectors are served from the prediction cache
+            prediction, class_name, confidence, confidence_max = self._cached_predict(
+                version, tuple(float(value) for value in features)
+            )
             
             result = {
-                'prediction': int(prediction[0]),
+                'prediction': prediction,
                 'class_name': class_name,
-                'confidence': prediction_proba[0].tolist(),
-                'confidence_max': float(np.max(prediction_proba[0])),
+                'confidence': confidence,
+                'confidence_max': confidence_max,
                 'model_version': version,
-                'timestamp': datetime.now().isoformat(),
-                'features_used': features
+                'timestamp': now_iso()
             }
             
-            logger.info(f"Prediction successful: {result}")
+            logger.debug("Prediction successful for features %s: %s", features, result)
             return result
             
         except Exception as e:
             logger.error(f"Prediction error with model {version}: {str(e)}")
             raise
     
+    def predict_batch(self, features: np.ndarray, version: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        Make predictions for a batch of samples with a single model call.
+        
+        Args:
+            features (np.ndarray): Input features of shape (n_samples, N_FEATURES)
+            version (str, optional): Model version to use
+            
+        Returns:
+            List[Dict[str, Any]]: One prediction result per input row
+        """
+        if version is None:
+            version = self.active_model_version
+        
+        if version not in self.models:
+            error_msg = f"Model version {version} not loaded"
+            logger.error(error_msg)
+            raise ValueError(error_msg)
+        
+        if features.ndim != 2 or features.shape[1] != N_FEATURES:
+            error_msg = f"Expected batch of shape (n, {N_FEATURES}), got {features.shape}"
+            logger.error(error_msg)
+            raise ValueError(error_msg)
+        
+        try:
+            # A single sample goes through the prediction cache
+            if features.shape[0] == 1:
+                prediction, class_name, confidence, confidence_max = self._cached_predict(
+                    version, tuple(features[0].tolist())
+                )
+                return [{
+                    'prediction': prediction,
+                    'class_name': class_name,
+                    'confidence': confidence,
+                    'confidence_max': confidence_max
+                }]
+            
+            meta = self.models[version]
+            predictions = meta.model.predict(features)
+            prediction_proba = meta.model.predict_proba(features)
+            
+            results = []
+            for prediction, confidence, confidence_max in zip(
+                predictions.tolist(),
+                prediction_proba.tolist(),
+                prediction_proba.max(axis=1).tolist()
+            ):
+                results.append({
+                    'prediction': int(prediction),
+                    'class_name': meta.class_name(prediction),
+                    'confidence': confidence,
+                    'confidence_max': confidence_max
+                })
+            
+            logger.debug("Batch prediction successful: %d samples", len(results))
+            return results
+            
+        except Exception as e:
+            logger.error(f"Batch prediction error with model {version}: {str(e)}")
+            raise
+    
+    def _predict_uncached(self, version: str, features: Tuple[float, ...]) -> Tuple[int, str, Tuple[float, ...], float]:
+        """
+        Run the model for a single sample; wrapped by the per-manager LRU cache.
+        
+        Args:
+            version (str): Model version identifier
+            features (Tuple[float, ...]): Input features as a hashable tuple
+            
+        Returns:
+            Tuple[int, str, Tuple[float, ...], float]: Prediction, class name,
+            class probabilities and maximum probability
+        """
+        # Write into this thread's preallocated (1, N_FEATURES) buffer
+        features_array = getattr(self._tls, 'buf', None)
+        if features_array is None:
+            features_array = self._tls.buf = np.empty((1, N_FEATURES), dtype=np.float64)
+        features_array[0, 0] = features[0]
+        features_array[0, 1] = features[1]
+        features_array[0, 2] = features[2]
+        features_array[0, 3] = features[3]
+        
+        # Make prediction, through the specialized predictor when there is one
+        meta = self.models[version]
+        if meta.fast_predict is not None:
+            prediction, prediction_proba = meta.fast_predict(features_array[0])
+        else:
+            prediction = meta.model.predict(features_array)[0]
+            prediction_proba = meta.model.predict_proba(features_array)[0]
+        prediction = int(prediction)
+        
+        return (
+            prediction,
+            meta.class_name(prediction),
+            tuple(prediction_proba.tolist()),
+            float(np.max(prediction_proba))
+        )
+    
     def get_model_info(self, version: str) -> Dict[str, Any]:
         """
         Get information about a loaded model.
@@ -149,21 +415,7 @@ class ModelManager:
         if version not in self.models:
             return {'error': f'Model version {version} not loaded'}
         
-        model = self.models[version]
-        info = {
-            'version': version,
-            'model_type': type(model).__name__,
-            'loaded': True,
-            'n_features': getattr(model, 'n_features_in_', 'unknown'),
-            'n_classes': getattr(model, 'n_classes_', 'unknown') if hasattr(model, 'n_classes_') else 'unknown',
-            'classes': getattr(model, 'classes_', []).tolist() if hasattr(model, 'classes_') else []
-        }
-        
-        # Add model-specific attributes
-        if hasattr(model, 'estimators_'):
-            info['n_estimators'] = len(model.estimators_)
-        
-        return info
+        return dict(self.models[version].info)
     
     def get_all_models_info(self) -> Dict[str, Any]:
         """
@@ -172,25 +424,53 @@ class ModelManager:
         Returns:
             Dict[str, Any]: Information about all models
         """
-        return {version: self.get_model_info(version) for version in self.loaded_versions}
+        return {version: self.get_model_info(version) for version in self.models}
+    
+    def get_health_body(self) -> bytes:
+        """
+        Get the serialized health check response.
+        
+        Apart from its timestamp, the body only changes when models are loaded
+        or the active version is switched, so it is rebuilt at most once per second.
+        
+        Returns:
+            bytes: JSON health check body
+        """
+        second = int(time.time())
+        cached = self._health_body
+        if cached is not None and cached[0] == second:
+            return cached[1]
+        
+        body = orjson.dumps({
+            'status': 'healthy' if self.loaded_versions else 'degraded',
+            'models_loaded': sorted(self.loaded_versions),
+            'active_model': self.active_model_version,
+            'timestamp': now_iso()
+        })
+        self._health_body = (second, body)
+        return body
     
     def set_active_version(self, version: str) -> bool:
         """
         Set the active model version for predictions.
         
+        Under a preloaded gunicorn, this affects only the calling worker.
+        
         Args:
             version (str): Model version identifier
             
         Returns:
             bool: True if version was set successfully, False otherwise
         """
-        if version in self.models:
-            self.active_model_version = version
-            logger.info(f"Active model version set to {version}")
-            return True
-        else:
-            logger.warning(f"Cannot set active version: model {version} not loaded")
-            return False
+        with self._lock:
+            if version in self.models:
+                self.active_model_version = version
+                self._health_body = None
+                logger.info(f"Active model version set to {version}")
+                return True
+        
+        logger.warning(f"Cannot set active version: model {version} not loaded")
+        return False
 
 # Global model manager instance
 model_manager = ModelManager()
@@ -206,8 +486,9 @@ def init_models(app=None):
         # Get models directory from app config or use default
         models_dir = getattr(app, 'config', {}).get('MODELS_DIR', 'app/models') if app else 'app/models'
         
-        global model_manager
-        model_manager = ModelManager(models_dir)
+        # Populate the shared instance in place: modules such as app.main
+        # imported model_manager before this runs and keep that reference
+        model_manager.models_dir = models_dir
         
         # Load all available models
         load_results = model_manager.load_all_models()
@@ -215,7 +496,7 @@ def init_models(app=None):
         if not any(load_results.values()):
             logger.warning("No models loaded successfully. Application may not function properly.")
         
-        logger.info(f"Models initialization completed. Loaded versions: {model_manager.loaded_versions}")
+        logger.info(f"Models initialization completed. Loaded versions: {sorted(model_manager.loaded_versions)}")
         return load_results
         
     except Exception as e:
@@ -6,12 +6,18 @@ bind = "0.0.0.0:5000"
 backlog = 2048
 
 # Worker processes
-workers = multiprocessing.cpu_count() * 2 + 1
-worker_class = 'sync'
-worker_connections = 1000
+# Threaded workers overlap per-request I/O; one process per core avoids
+# oversubscribing CPUs with the extra threads
+workers = multiprocessing.cpu_count()
+worker_class = 'gthread'
+threads = 8
 timeout = 30
 keepalive = 2
 
+# Load the app (and its models) once in the master; workers share the
+# loaded models copy-on-write instead of each calling joblib.load
+preload_app = True
+
 # Logging
 loglevel = 'info'
 accesslog = 'logs/gunicorn_access.log'
@@ -28,6 +34,13 @@ user = None
 group = None
 tmp_upload_dir = None
 
+# Server hooks
+def post_fork(server, worker):
+    # Start this worker's logging threads up front rather than on its
+    # first log record
+    from app.logging_config import start_log_threads
+    start_log_threads()
+
 # SSL
 # keyfile = None
 # certfile = None
\ No newline at end of file
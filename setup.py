@@ -11,20 +11,30 @@ setup(
         "numpy==1.24.3",
         "scikit-learn==1.3.0",
         "joblib==1.3.2",
+        "lz4==4.3.2",
         "gunicorn==21.2.0",
         "python-dotenv==1.0.0",
         "flasgger==0.9.5",
         "Flask-Limiter==3.5.0",
+        "redis==5.0.1",
+        "orjson==3.9.10",
     ],
     extras_require={
         "dev": [
             "pytest==7.4.0",
             "pytest-flask==1.3.0",
         ],
+        "hummingbird": [
+            "hummingbird-ml==0.4.9",
+        ],
+        "onnx": [
+            "skl2onnx==1.15.0",
+            "onnxruntime==1.16.1",
+        ],
     },
     author="Your Name",
     author_email="your.email@example.com",
     description="A production-ready ML model deployment API",
     keywords="flask ml machine-learning api",
-    python_requires=">=3.8",
+    python_requires=">=3.9",
 )
\ No newline at end of file
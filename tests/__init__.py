@@ -13,13 +13,6 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
 # Import test modules
 from .test_api import TestMLAPI
+from .test_models import TestFastPredict, TestModelManager
 
-__all__ = ['TestMLAPI']
-
-from flask import Flask
-from .main import bp
-
-def create_app():
-    app = Flask(__name__)
-    app.register_blueprint(bp)
-    return app
\ No newline at end of file
+__all__ = ['TestMLAPI', 'TestFastPredict', 'TestModelManager']
\ No newline at end of file
@@ -1,6 +1,5 @@
 # tests/test_api.py (updated)
 import unittest
-import requests 
 import json
 import os
 import sys
@@ -9,7 +8,8 @@ import sys
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
 from app import create_app
-from app.models import load_model
+from app.models import model_manager
+from app.models.model_utils import MAX_BATCH_SIZE
 
 class TestMLAPI(unittest.TestCase):
     
@@ -27,6 +27,18 @@ class TestMLAPI(unittest.TestCase):
         self.assertEqual(response.status_code, 200)
         self.assertIn('status', response.get_json())
     
+    def test_health_check_not_rate_limited(self):
+        # More probes than the default limit of 50 per hour
+        for _ in range(60):
+            response = self.client.get('/health')
+            self.assertEqual(response.status_code, 200)
+    
+    def test_health_reloaded_version_listed_once(self):
+        model_manager.load_model('v1')
+        model_manager.load_model('v1')
+        response = self.client.get('/health')
+        self.assertEqual(response.get_json()['models_loaded'], ['v1'])
+    
     def test_prediction_valid(self):
         data = {'features': [5.1, 3.5, 1.4, 0.2]}
         response = self.client.post(
@@ -39,6 +51,75 @@ class TestMLAPI(unittest.TestCase):
         self.assertIn('prediction', json_data)
         self.assertIn('confidence', json_data)
     
+    def test_prediction_batch_valid(self):
+        data = {'batch': [[5.1, 3.5, 1.4, 0.2], [6.7, 3.0, 5.2, 2.3]]}
+        response = self.client.post(
+            '/predict_batch', 
+            json=data, 
+            headers=self.headers
+        )
+        self.assertEqual(response.status_code, 200)
+        json_data = response.get_json()
+        self.assertEqual(len(json_data['predictions']), 2)
+        self.assertIn('confidence', json_data['predictions'][0])
+    
+    def test_prediction_batch_wrong_shape(self):
+        data = {'batch': [[5.1, 3.5, 1.4]]}
+        response = self.client.post(
+            '/predict_batch', 
+            json=data, 
+            headers=self.headers
+        )
+        self.assertEqual(response.status_code, 400)
+    
+    def test_prediction_batch_single_row(self):
+        features = [5.1, 3.5, 1.4, 0.2]
+        single = self.client.post(
+            '/predict', 
+            json={'features': features}, 
+            headers=self.headers
+        ).get_json()
+        hits = model_manager._cached_predict.cache_info().hits
+        
+        response = self.client.post(
+            '/predict_batch', 
+            json={'batch': [features]}, 
+            headers=self.headers
+        )
+        self.assertEqual(response.status_code, 200)
+        predictions = response.get_json()['predictions']
+        self.assertEqual(len(predictions), 1)
+        self.assertEqual(predictions[0]['prediction'], single['prediction'])
+        self.assertEqual(predictions[0]['confidence'], single['confidence'])
+        # A single row is answered from the cache entry /predict just filled
+        self.assertEqual(model_manager._cached_predict.cache_info().hits, hits + 1)
+    
+    def test_prediction_batch_out_of_range(self):
+        data = {'batch': [[5.1, 3.5, 1.4, 0.2], [6.7, 3.0, 11.0, 2.3]]}
+        response = self.client.post(
+            '/predict_batch', 
+            json=data, 
+            headers=self.headers
+        )
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(
+            response.get_json()['error'],
+            'Feature at index 2 of sample 1 must be between 0 and 10, got 11.0'
+        )
+    
+    def test_prediction_batch_too_large(self):
+        data = {'batch': [[5.1, 3.5, 1.4, 0.2]] * (MAX_BATCH_SIZE + 1)}
+        response = self.client.post(
+            '/predict_batch', 
+            json=data, 
+            headers=self.headers
+        )
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(
+            response.get_json()['error'],
+            f'Batch must contain at most {MAX_BATCH_SIZE} samples, got {MAX_BATCH_SIZE + 1}'
+        )
+    
     # ... other test methods
 
 if __name__ == '__main__':
@@ -0,0 +1,92 @@
+# tests/test_models.py
+import unittest
+import os
+import shutil
+import sys
+import tempfile
+
+import numpy as np
+from sklearn.datasets import load_iris
+from sklearn.linear_model import LogisticRegression
+
+# Add the app directory to the Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from app.models.models import ModelManager, build_fast_predict
+
+MODELS_DIR = os.path.join(os.path.dirname(__file__), '..', 'app', 'models')
+
+class TestFastPredict(unittest.TestCase):
+    
+    def setUp(self):
+        iris = load_iris()
+        self.X, self.y = iris.data, iris.target
+        # Versicolor vs virginica overlap, so probabilities are not all ~0 or ~1
+        binary = self.y > 0
+        self.X_binary, self.y_binary = self.X[binary], self.y[binary]
+    
+    def assert_matches_sklearn(self, model, X):
+        fast_predict = build_fast_predict(model)
+        self.assertIsNotNone(fast_predict)
+        
+        predictions = model.predict(X)
+        prediction_proba = model.predict_proba(X)
+        for x, prediction, proba in zip(X, predictions, prediction_proba):
+            fast_prediction, fast_proba = fast_predict(x)
+            self.assertEqual(fast_prediction, prediction)
+            np.testing.assert_allclose(fast_proba, proba, rtol=1e-9, atol=1e-12)
+    
+    def test_binary_ovr(self):
+        model = LogisticRegression().fit(self.X_binary, self.y_binary)
+        self.assert_matches_sklearn(model, self.X_binary)
+    
+    def test_binary_multinomial_not_specialized(self):
+        model = LogisticRegression(multi_class='multinomial').fit(self.X_binary, self.y_binary)
+        self.assertIsNone(build_fast_predict(model))
+    
+    def test_multiclass_multinomial(self):
+        model = LogisticRegression(max_iter=1000).fit(self.X, self.y)
+        self.assert_matches_sklearn(model, self.X)
+    
+    def test_multiclass_ovr_not_specialized(self):
+        model = LogisticRegression(multi_class='ovr', max_iter=1000).fit(self.X, self.y)
+        self.assertIsNone(build_fast_predict(model))
+
+class TestModelManager(unittest.TestCase):
+    
+    def setUp(self):
+        self.manager = ModelManager(MODELS_DIR)
+        self.assertTrue(self.manager.load_model('v1'))
+    
+    def test_reload_lists_version_once(self):
+        self.assertTrue(self.manager.load_model('v1'))
+        self.assertEqual(self.manager.loaded_versions, {'v1'})
+    
+    def test_reload_clears_prediction_cache(self):
+        self.manager.predict([5.1, 3.5, 1.4, 0.2])
+        self.assertEqual(self.manager._cached_predict.cache_info().currsize, 1)
+        
+        self.manager.load_model('v1')
+        self.assertEqual(self.manager._cached_predict.cache_info().currsize, 0)
+    
+    def test_reload_clears_health_body(self):
+        self.manager.get_health_body()
+        self.assertIsNotNone(self.manager._health_body)
+        
+        self.manager.load_model('v1')
+        self.assertIsNone(self.manager._health_body)
+    
+    def test_load_all_models_strips_affixes_exactly(self):
+        with tempfile.TemporaryDirectory() as models_dir:
+            shutil.copy(os.path.join(MODELS_DIR, 'model_v1.pkl'), os.path.join(models_dir, 'model_model_v1.pkl'))
+            # Matches the file name pattern but is not a file
+            os.mkdir(os.path.join(models_dir, 'model_x.pkl'))
+            
+            manager = ModelManager(models_dir)
+            results = manager.load_all_models()
+        
+        self.assertEqual(results, {'model_v1': True})
+        self.assertEqual(manager.loaded_versions, {'model_v1'})
+
+if __name__ == '__main__':
+    unittest.main()
\ No newline at end of file